@@ -8,11 +8,11 @@ frames = session.GetFrames()
 joints = session.GetJoints()
 areas = session.GetAreas()
 
-for i in frames:
-    print(i, frames[i])
+for i, frame in enumerate(frames):
+    print(i, frame)
 
-for i in joints:
-    print(i, joints[i])
+for i, joint in enumerate(joints):
+    print(i, joint)
 
-for i in areas:
-    print(i, areas[i], len(areas[i]))
\ No newline at end of file
+for i, area in enumerate(areas):
+    print(i, area, len(area))
@@ -1,8 +1,62 @@
 import numpy as np
+from threading import local
 from typing import Union
 
+from . import _kernels
+
 Array1D = Union[np.ndarray, float]
 
+# Scratch arrays are only pooled from this batch size up, below it reusing
+# them is not measurably faster than np.empty
+_POOL_MIN_SIZE = 20000
+
+_scratch = local()
+
+
+def _buf(n, dtype, k):
+    """Borrow scratch array number ``k`` of length ``n`` and type ``dtype``.
+
+    The buffers are kept per thread and reused across calls, e.g. over load
+    cases, so they must only hold intermediates that do not escape the call.
+    Each buffer grows to the largest ``n`` requested and a view is returned;
+    the memory is only released when the thread exits. Batches smaller than
+    ``_POOL_MIN_SIZE`` get a new array instead.
+    """
+    if n < _POOL_MIN_SIZE:
+        return np.empty(n, dtype)
+
+    pool = getattr(_scratch, 'pool', None)
+    if pool is None:
+        pool = _scratch.pool = {}
+    key = (np.dtype(dtype), k)
+    buf = pool.get(key)
+    if buf is None or buf.shape[0] < n:
+        buf = pool[key] = np.empty(n, dtype)
+    return buf[:n]
+
+
+def _broadcast_flat(*args, dtype=np.float64):
+    """Broadcast the inputs against each other as flat arrays of ``dtype``.
+
+    Returns the list of contiguous, writeable 1D arrays and the common
+    broadcast shape, so that compiled kernels can loop over members and the
+    result can be reshaped back to what the caller passed in. Index the
+    reshaped result with ``[()]`` so that scalar inputs give a scalar.
+    """
+    arrays = [np.asarray(a, dtype=dtype) for a in args]
+    shape = np.broadcast(*arrays).shape
+    flat = []
+    for a in arrays:
+        # inputs that already have the full shape are passed through when
+        # possible, everything else is copied into a new array
+        if a.shape != shape or not (a.flags.c_contiguous and
+                                    a.flags.writeable):
+            b = np.empty(shape, dtype=dtype)
+            b[...] = a
+            a = b
+        flat.append(a.reshape(-1))
+    return flat, shape
+
 
 def P_delta(Pr: Array1D,
             I: Array1D,
@@ -42,16 +96,15 @@ def P_delta(Pr: Array1D,
 
     # TODO: tao_b is assumed to be 1, implement Chapter C3
     # Do all forces have the same sign? (we don't want to handle edge cases)
-    assert np.all(Pr > 0) if Pr[0] > 0 else np.all(Pr < 0), \
+    # Zero forces count as positive, adding +0.0 turns -0.0 into +0.0
+    assert np.ptp(np.signbit(np.add(Pr, 0.0)).view(np.uint8)) == 0, \
         "Not all forces have the same sign, are some columns in tension?"
-    Pr = np.abs(Pr)
 
-    # Elastic critical buckling strength (AISC A-8-5)
-    Pe1 = np.pi**2 * 0.8 * tao_b * E * I / (Lb)**2
-
-    # AISC Appendix 8, (AISC A-8-3)
-    B1 = Cm / (1 - alpha * Pr/Pe1)
-    return B1
+    # Elastic critical buckling strength (AISC A-8-5) and B1 (AISC A-8-3)
+    (Pr, I, Lb, Cm), shape = _broadcast_flat(Pr, I, Lb, Cm)
+    return _kernels.run(_kernels.p_delta, np.empty(Pr.shape),
+                        Pr, I, Lb, Cm, float(E), float(tao_b),
+                        float(alpha)).reshape(shape)[()]
 
 
 def E3_compression(A: Array1D,
@@ -85,17 +138,9 @@ def E3_compression(A: Array1D,
 
     """
 
-    # Elastic buckling stress (AISC E3-4)
-    r_min = np.minimum(rx, ry)
-    Fe = np.pi**2 * E / (Lb / r_min)**2
-
-    # Critical stress, (AISC E3-2, E3-3)
-    Fcr = np.where(Fy / Fe <= 2.25,
-                   0.658**(Fy / Fe) * Fy,  # Inelastic
-                   0.877 * Fe)  # Elastic
-
-    phiPn = 0.9*Fcr*A
-    return phiPn
+    (A, rx, ry, Lb, Fy), shape = _broadcast_flat(A, rx, ry, Lb, Fy)
+    return _kernels.run(_kernels.e3_compression, np.empty(A.shape),
+                        A, rx, ry, Lb, Fy, float(E)).reshape(shape)[()]
 
 
 def F2_flexure_major(Lb: Array1D,
@@ -111,7 +156,8 @@ def F2_flexure_major(Lb: Array1D,
                      Cw: Union[Array1D, None] = None,
                      props: Union[dict, None] = None,
                      Cb: Array1D = 1.0,
-                     E: float = 29000) -> Array1D:
+                     E: float = 29000,
+                     dtype: np.dtype = np.float64) -> Array1D:
     r"""
     AISC Chapter F Design of Members for Flexure (F2)
 
@@ -152,6 +198,10 @@ def F2_flexure_major(Lb: Array1D,
         diagrams. The default is 1.0.
     E : float, optional
         Modulus of elasticity of steel. 29000 ksi (200,000 MPa)
+    dtype : np.dtype, optional
+        Floating point type used for the computation. ``np.float32`` halves
+        the memory traffic at a relative error of about 1e-6, well below
+        design accuracy. The default is ``np.float64``.
 
     Returns
     -------
@@ -161,59 +211,43 @@ def F2_flexure_major(Lb: Array1D,
     """
 
     if props is not None:
-        section = props['Type']
-        ho = props['ho'].astype('float64')
-        J = props['J'].astype('float64')
-        Sx = props['Sx'].astype('float64')
-        Zx = props['Zx'].astype('float64')
-        ry = props['ry'].astype('float64')
-        rts = props['rts'].astype('float64')
+        section_type = props['Type']
+        ho = props['ho'].astype(dtype)
+        J = props['J'].astype(dtype)
+        Sx = props['Sx'].astype(dtype)
+        Zx = props['Zx'].astype(dtype)
+        ry = props['ry'].astype(dtype)
+        rts = props['rts'].astype(dtype)
         # only used for channels
-        if np.any(section == 'C'):
-            Iy = props['Iy'].astype('float64')
-            Cw = props['Cw'].astype('float64')
+        if np.any(section_type == 'C'):
+            Iy = props['Iy'].astype(dtype)
+            Cw = props['Cw'].astype(dtype)
         else:
             Iy = 0.0
             Cw = 1.0
 
-    # AISC F2-8
-    assert np.all((section == 'W') | (section == 'C')), \
+    is_W = np.asarray(section_type) == 'W'
+    assert np.all(is_W | (np.asarray(section_type) == 'C')), \
         """section_type array contains elements other than 'W' or 'C'.
         F2 is only defined for W or C shapes"""
-    c = np.where(section == "W", 1, ho / 2 * np.sqrt(Iy/Cw))
-
-    # Plastic moment (AISC F2-1)
-    Mp = Fy * Zx
-
-    # Limiting laterally unbraced length for the limit state of yielding,
-    # (AISC F2-5)
-    Lp = 1.76 * ry * np.sqrt(E / Fy)
-
-    # Limiting laterally unbraced length for the limit state of inelastic
-    # lateral-torsional buckling, (AISC F2-6)
-    Lr = 1.95 * rts * E / (0.7 * Fy) * np.sqrt(J * c / (Sx * ho) +
-                                               np.sqrt((J * c / (Sx * ho))**2 +
-                                                       6.76*(0.7 * Fy / E)**2)
-                                               )
 
-    # Elastic lateral-torsional buckling moment (AISC F2-3, F2-4)
-    Mn_elastic = Cb*np.pi**2*E / (Lb/rts)**2 *\
-        np.sqrt(1 + 0.078*(J*c)/(Sx*ho) * (Lb/rts)**2) * Sx
+    (Lb, Fy, ho, J, Sx, Zx, ry, rts, Cb), shape = \
+        _broadcast_flat(Lb, Fy, ho, J, Sx, Zx, ry, rts, Cb, dtype=dtype)
 
-    # Inelastic lateral-torsional buckling moment (AISC F2-2)
-    Mn_inelastic = Cb*(Mp - (Mp - 0.7*Fy*Sx) * (Lb - Lp)/(Lr - Lp))
+    # AISC F2-8a, c = 1 for doubly symmetric I-shapes. Most models have no
+    # channels and use a kernel variant with the channel arithmetic removed.
+    c = None
+    if not is_W.all():
+        # AISC F2-8b, c for channels, only evaluated on the channel members
+        c = np.ones_like(Lb)
+        idx = np.flatnonzero(np.broadcast_to(~is_W, shape))
+        Iy, Cw = (np.broadcast_to(np.asarray(a, dtype=dtype),
+                                  shape).reshape(-1)[idx] for a in (Iy, Cw))
+        c[idx] = ho[idx] / 2 * np.sqrt(Iy/Cw)
 
-    # Nominal flexural strength
-    Mn = np.where(Lb <= Lp,
-                  Mp,
-                  np.where(Lb > Lr,
-                           np.minimum(Mp, Mn_elastic),
-                           np.minimum(Mp, Mn_inelastic)
-                           )
-                  )
-
-    phiMnx = 0.9 * Mn
-    return phiMnx
+    return _kernels.run(_kernels.f2_flexure_major, np.empty_like(Lb),
+                        Lb, Fy, ho, J, Sx, Zx, ry, rts, Cb, c,
+                        Lb.dtype.type(E)).reshape(shape)[()]
 
 
 def F6_flexure_minor(Sy: Array1D,
@@ -247,36 +281,9 @@ def F6_flexure_minor(Sy: Array1D,
 
     """
 
-    # Width-to-thickness ratios: AISC TABLE B4.1b Case 10
-    # Limiting ratio for compact/noncompact section
-    lambda_pf = 0.38 * np.sqrt(E / Fy)
-
-    # Limiting ratio for noncompact/slender section
-    lambda_rf = np.sqrt(E / Fy)
-
-    # Plastic moment (AISC F6-1)
-    Mp = np.minimum(Fy*Zy, 1.6*Fy*Sy)
-
-    # Flange Local Buckling
-    is_compact = lambda_f <= lambda_pf
-    is_slender = lambda_f >= lambda_rf
-
-    # Elastic flange local buckling moment (AISC F6-3, F6-4)
-    Mn_elastic = (0.69*E*Sy) / lambda_f**2
-
-    # Nominal flexural strength
-    # For non-compact flanges, interpolate between Mp and reduced moment
-    Mn = np.where(is_compact,
-                  Mp,
-                  np.where(is_slender,
-                           Mn_elastic,
-                           Mp - (Mp - 0.7 * Fy * Sy) *
-                           (lambda_f - lambda_pf) / (lambda_rf - lambda_pf)
-                           )
-                  )
-
-    phiMny = 0.9*Mn
-    return phiMny
+    (Sy, Zy, lambda_f, Fy), shape = _broadcast_flat(Sy, Zy, lambda_f, Fy)
+    return _kernels.run(_kernels.f6_flexure_minor, np.empty(Sy.shape),
+                        Sy, Zy, lambda_f, Fy, float(E)).reshape(shape)[()]
 
 
 def F8_flexure_round_hss(D: Array1D,
@@ -307,38 +314,14 @@ def F8_flexure_round_hss(D: Array1D,
     Returns
     -------
     Array1D
-        Section moment capacity, :math:`\phi M_n`, (kip-in, N-mm).
+        Section moment capacity, :math:`\phi M_n`, (kip-in, N-mm). NaN for
+        members where F8 does not apply (:math:`D/t \geq 0.45 E/F_y`).
 
     """
 
-    assert np.all(D/t < 0.45*E/Fy), "F8 does not apply if D/t > 0.45 E/Fy"
-
-    # Yielding (AISC F8-1)
-    Mp = Fy*Z
-
-    # Local buckling
-    lambda_p = 0.07 * E/Fy  # Limiting ratio for compact/noncompact section
-    lambda_r = 0.31 * E/Fy  # Limiting ratio for noncompact/slender section
-
-    is_slender = D/t >= lambda_r
-    is_compact = D/t < lambda_p
-
-    # Noncompact sections
-    Mn_noncompact = (0.021*E/(D/t) + Fy) * S
-
-    # Slender sections
-    Fcr = 0.33*E/(D/t)
-    Mn_slender = Fcr * S
-
-    Mn = np.where(is_compact,
-                  Mp,
-                  np.where(is_slender,
-                           np.minimum(Mp, Mn_slender),
-                           np.minimum(Mp, Mn_noncompact)
-                           )
-                  )
-    phiMn = 0.9*Mn
-    return phiMn
+    (D, t, S, Z, Fy), shape = _broadcast_flat(D, t, S, Z, Fy)
+    return _kernels.run(_kernels.f8_flexure_round_hss, np.empty(D.shape),
+                        D, t, S, Z, Fy, float(E)).reshape(shape)[()]
 
 
 def F9_flexure_t_2l(shape: Union[Array1D, str],
@@ -406,66 +389,93 @@ def F9_flexure_t_2l(shape: Union[Array1D, str],
     # maybe this needs to be two functions?
     # TODO: test behavior - how is tension boolean handled?
 
-    # 1. Yielding (AISC F9-2, F9-3)
-    Mp = np.where(stem_tension,
-                  np.minimum(Fy*Zx, 1.6*Fy*Sx),
-                  np.minimum(Fy*Zx, Fy*Sx)
-                  )
-
-    # 2. Lateral-torsional Buckling (AISC F9-4)
-    B = np.where(stem_tension, 1, -1) * 2.3 * (d / Lb) * np.sqrt(Iy / J)
-    Mcr = np.pi * np.sqrt(E * Iy * G * J)/Lb * (B + np.sqrt(1 + B**2))
-
-    # 3. Flange Local Buckling of Tees #
-    # This assumes flanges in flexural compression (stem in tension)
-
-    # TODO verify correct case
-    # Width-to-thickness ratios: AISC TABLE B4.1b Case 10
-    # Limiting ratio for compact/noncompact section
-    lambda_pf = 0.38 * np.sqrt(E / Fy)
-
-    # Limiting ratio for noncompact/slender section
-    lambda_rf = np.sqrt(E / Fy)
-
-    is_compact = lambda_f <= lambda_pf
-    is_slender = lambda_f >= lambda_rf
-
-    # Nominal flexural strength
-    S_xc = Iy / y  # elastic section modulus referred to the compression flange
-    Mn_flb = np.where(is_compact,
-                      np.inf,  # flange local buckling does not apply
-                      np.where(is_slender,
-                               0.7 * E * S_xc / lambda_f**2,
-                               np.minimum(Mp - (Mp - 0.7*Fy*S_xc) *\
-                                          (lambda_f - lambda_pf) /\
-                                          (lambda_rf - lambda_pf),
-                                          1.6 * Fy * Sx)
-                               )
-                      )
-
-    # 4. Local Buckling of Tee Stems in Flexural Compression
-    d_div_tw = d/tw
-    Fcr = np.where(d_div_tw <= 0.84 * np.sqrt(E/Fy),
-                   Fy,
-                   np.where(d_div_tw <= 1.03 * np.sqrt(E/Fy),
-                            Fy*(2.55 - 1.84 * d_div_tw * np.sqrt(Fy/E)),
-                            0.69*E/d_div_tw**2)
-                   )
-    Mn_slb = Fcr * Sx
-
-    # Clauses 1 & 2
-    Mn_tension = np.minimum(Mp, Mcr)
-
-    # Clauses 3 & 4
-    # TODO: fix logic. do we need to return different phiMn for each axis?
-    Mn_lb = np.minimum(Mn_flb,
-                       np.where(stem_tension,
-                                np.inf,
-                                Mn_slb)
-                       )
-
-    phiMn = 0.9*np.minimum(Mn_tension, Mn_lb)
-    return phiMn
+    (stem_tension, d, tw, Sx, Zx, J, Iy, y, lambda_f, Lb, Fy), out_shape = \
+        _broadcast_flat(stem_tension, d, tw, Sx, Zx, J, Iy, y, lambda_f,
+                        Lb, Fy)
+    stem_tension = stem_tension != 0
+    n = Lb.shape[0]
+
+    # Each slenderness branch below is only evaluated on the members it
+    # governs, errstate silences the remaining divisions by zero (e.g. Lb=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # 1. Yielding (AISC F9-2, F9-3)
+        Mp = np.minimum(Fy*Zx, np.where(stem_tension, 1.6, 1.0) * Fy*Sx)
+
+        # 2. Lateral-torsional Buckling (AISC F9-4)
+        B = np.where(stem_tension, 1, -1) * 2.3 * (d / Lb) * np.sqrt(Iy / J)
+        Mcr = np.pi * np.sqrt(E * Iy * G * J)/Lb * (B + np.sqrt(1 + B**2))
+
+        # 3. Flange Local Buckling of Tees #
+        # This assumes flanges in flexural compression (stem in tension)
+
+        # TODO verify correct case
+        # Width-to-thickness ratios: AISC TABLE B4.1b Case 10
+        sqrt_E_Fy = np.divide(E, Fy, out=_buf(n, np.float64, 0))
+        np.sqrt(sqrt_E_Fy, out=sqrt_E_Fy)
+
+        # Limiting ratio for compact/noncompact section
+        lambda_pf = 0.38 * sqrt_E_Fy
+
+        # Limiting ratio for noncompact/slender section
+        lambda_rf = sqrt_E_Fy
+
+        is_compact = lambda_f <= lambda_pf
+        is_slender = lambda_f >= lambda_rf
+
+        # Nominal flexural strength
+        # flange local buckling does not apply to compact flanges
+        Mn_flb = _buf(n, np.float64, 1)
+        Mn_flb.fill(np.inf)
+
+        idx = np.flatnonzero(~is_compact & is_slender)
+        # elastic section modulus referred to the compression flange
+        S_xc = Iy[idx] / y[idx]
+        Mn_flb[idx] = 0.7 * E * S_xc / lambda_f[idx]**2
+
+        idx = np.flatnonzero(~is_compact & ~is_slender)
+        S_xc = Iy[idx] / y[idx]
+        Mn_flb[idx] = np.minimum(Mp[idx] - (Mp[idx] - 0.7*Fy[idx]*S_xc) *
+                                 (lambda_f[idx] - lambda_pf[idx]) /
+                                 (lambda_rf[idx] - lambda_pf[idx]),
+                                 1.6 * Fy[idx] * Sx[idx])
+
+        # 4. Local Buckling of Tee Stems in Flexural Compression
+        # only applies where the stem is not in tension
+        d_div_tw = d/tw
+        stem_compression = ~stem_tension
+        Fcr = _buf(n, np.float64, 2)
+
+        idx = np.flatnonzero(stem_compression &
+                             (d_div_tw <= 0.84 * sqrt_E_Fy))
+        Fcr[idx] = Fy[idx]
+
+        idx = np.flatnonzero(stem_compression &
+                             (d_div_tw > 0.84 * sqrt_E_Fy) &
+                             (d_div_tw <= 1.03 * sqrt_E_Fy))
+        Fcr[idx] = Fy[idx]*(2.55 - 1.84 * d_div_tw[idx] * np.sqrt(Fy[idx]/E))
+
+        # written as a negation so that, as with np.where, members with a
+        # NaN d/tw fall through to this branch and stay NaN
+        idx = np.flatnonzero(stem_compression &
+                             ~(d_div_tw <= 1.03 * sqrt_E_Fy))
+        Fcr[idx] = 0.69*E/d_div_tw[idx]**2
+
+        # stem-in-tension members keep Mn_slb = inf, Fcr*Sx is only formed
+        # where the stem is in compression (inf*0 would give NaN for Sx = 0)
+        Mn_slb = _buf(n, np.float64, 3)
+        Mn_slb.fill(np.inf)
+        idx = np.flatnonzero(stem_compression)
+        Mn_slb[idx] = Fcr[idx] * Sx[idx]
+
+        # Clauses 1 & 2
+        Mn_tension = np.minimum(Mp, Mcr, out=Mcr)
+
+        # Clauses 3 & 4
+        # TODO: fix logic. do we need to return different phiMn for each axis?
+        Mn_lb = np.minimum(Mn_flb, Mn_slb, out=Mn_flb)
+
+        phiMn = 0.9*np.minimum(Mn_tension, Mn_lb)
+    return phiMn.reshape(out_shape)[()]
 
 
 def H1_interaction(Pr: Array1D,
@@ -499,16 +509,11 @@ def H1_interaction(Pr: Array1D,
 
     """
 
-    assert np.all(Pr > 0) if Pr[0] > 0 else np.all(Pr < 0), \
+    # Zero forces count as positive, adding +0.0 turns -0.0 into +0.0
+    assert np.ptp(np.signbit(np.add(Pr, 0.0)).view(np.uint8)) == 0, \
         "Not all forces have the same sign, are some columns in tension?"
-    Pr = np.abs(Pr)
-
-    M_total_int = np.abs(Mrx)/Mcx + np.abs(Mry)/Mcy
-
-    # AISC H1
-    DCR = np.where(Pr/Pc >= 0.2,
-                   Pr/Pc + 8/9 * M_total_int,
-                   Pr/Pc/2 + M_total_int
-                   )
 
-    return DCR
+    (Pr, Pc, Mrx, Mcx, Mry, Mcy), shape = \
+        _broadcast_flat(Pr, Pc, Mrx, Mcx, Mry, Mcy)
+    return _kernels.run(_kernels.h1_interaction, np.empty(Pr.shape),
+                        Pr, Pc, Mrx, Mcx, Mry, Mcy).reshape(shape)[()]
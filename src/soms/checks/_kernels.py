@@ -0,0 +1,211 @@
+"""Compiled per-member kernels behind the AISC checks.
+
+Every kernel takes contiguous arrays of equal length (see
+``AISC._broadcast_flat``) and fuses a whole check into a single loop over
+members, without intermediate arrays, writing into the ``out`` array passed
+last. The kernels release the GIL and are compiled on first use; ``run``
+calls them on the current thread for small batches and splits large ones
+across a thread pool.
+"""
+
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+import numba
+import numpy as np
+
+# 0.658**x is evaluated as exp(ln(0.658)*x), which vectorizes, unlike pow()
+_LN_0_658 = math.log(0.658)
+_PI2 = math.pi**2
+
+# fastmath without 'nnan'/'ninf': NaN inputs must keep propagating to the
+# result, as they do through the equivalent NumPy expressions
+_FASTMATH = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+
+@numba.njit(inline='always')
+def _min(a, b):
+    # NaN-propagating min, like np.minimum (the builtin min drops a NaN b)
+    return a if a < b or math.isnan(a) else b
+
+
+# Below this many members a check runs on the calling thread: handing the
+# chunks to the pool costs more than the loop itself.
+PARALLEL_MIN_SIZE = 50000
+
+# CPUs this process may run on, which respects affinity masks and cgroup
+# cpusets where the platform exposes them
+if hasattr(os, 'sched_getaffinity'):
+    _WORKERS = len(os.sched_getaffinity(0))
+else:
+    _WORKERS = os.cpu_count() or 1
+
+_executor = None
+_executor_lock = Lock()
+
+
+def run(kernel, out, *args):
+    """Evaluate ``kernel(*args, out)`` and return ``out``.
+
+    Batches of at least ``PARALLEL_MIN_SIZE`` members are split into one
+    chunk per CPU, array arguments are sliced, scalars passed as they are.
+    """
+    global _executor
+
+    if out.shape[0] < PARALLEL_MIN_SIZE or _WORKERS == 1:
+        kernel(*args, out)
+        return out
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=_WORKERS)
+
+    bounds = np.linspace(0, out.shape[0], _WORKERS + 1).astype(int)
+
+    def chunk(lo, hi):
+        kernel(*(a[lo:hi] if isinstance(a, np.ndarray) else a
+                 for a in args), out[lo:hi])
+
+    # list() re-raises the first exception of a chunk, if any
+    list(_executor.map(chunk, bounds[:-1], bounds[1:]))
+    return out
+
+
+@numba.njit(nogil=True, fastmath=_FASTMATH, error_model='numpy', cache=True)
+def p_delta(Pr, I_, Lb, Cm, E, tao_b, alpha, B1):
+    n = Pr.shape[0]
+    for i in range(n):
+        # Elastic critical buckling strength (AISC A-8-5)
+        Pe1 = _PI2 * 0.8 * tao_b * E * I_[i] / Lb[i]**2
+
+        # AISC Appendix 8, (AISC A-8-3)
+        B1[i] = Cm[i] / (1 - alpha * abs(Pr[i])/Pe1)
+
+
+@numba.njit(nogil=True, fastmath=_FASTMATH, error_model='numpy', cache=True)
+def e3_compression(A, rx, ry, Lb, Fy, E, phiPn):
+    n = A.shape[0]
+    for i in range(n):
+        # Elastic buckling stress (AISC E3-4)
+        r_min = _min(rx[i], ry[i])
+        Fe = _PI2 * E / (Lb[i] / r_min)**2
+
+        # Critical stress, (AISC E3-2, E3-3)
+        if Fy[i] / Fe <= 2.25:
+            Fcr = math.exp(_LN_0_658 * (Fy[i] / Fe)) * Fy[i]  # Inelastic
+        else:
+            Fcr = 0.877 * Fe  # Elastic
+
+        phiPn[i] = 0.9*Fcr*A[i]
+
+
+# Specialized by numba on the float32/float64 dtype requested by
+# F2_flexure_major. E and every literal are cast to that dtype, so float32
+# inputs are also computed in single precision.
+@numba.njit(nogil=True, fastmath=_FASTMATH, error_model='numpy', cache=True)
+def f2_flexure_major(Lb, Fy, ho, J, Sx, Zx, ry, rts, Cb, c, E, phiMnx):
+    # c is None when every member is a doubly symmetric I-shape: c = 1
+    # (AISC F2-8a) and numba compiles a variant with the product removed
+    t = Lb.dtype.type
+    pi2 = t(_PI2)
+    n = Lb.shape[0]
+    for i in range(n):
+        # Plastic moment (AISC F2-1)
+        Mp = Fy[i] * Zx[i]
+
+        # Limiting laterally unbraced length for the limit state of yielding,
+        # (AISC F2-5)
+        Lp = t(1.76) * ry[i] * math.sqrt(E / Fy[i])
+
+        # Limiting laterally unbraced length for the limit state of inelastic
+        # lateral-torsional buckling, (AISC F2-6)
+        Jc = J[i] if c is None else J[i] * c[i]
+        Jc_Sxho = Jc / (Sx[i] * ho[i])
+        Fy_07 = t(0.7) * Fy[i]
+        Lr = t(1.95) * rts[i] * E / Fy_07 * \
+            math.sqrt(Jc_Sxho + math.sqrt(Jc_Sxho**2 + t(6.76)*(Fy_07 / E)**2))
+
+        # Nominal flexural strength
+        if Lb[i] <= Lp:
+            Mn = Mp
+        elif Lb[i] > Lr:
+            # Elastic lateral-torsional buckling moment (AISC F2-3, F2-4)
+            Lb_rts2 = (Lb[i] / rts[i])**2
+            Mn = _min(Mp, Cb[i]*pi2*E / Lb_rts2 *
+                      math.sqrt(t(1) + t(0.078)*Jc_Sxho * Lb_rts2) * Sx[i])
+        else:
+            # Inelastic lateral-torsional buckling moment (AISC F2-2)
+            Mn = _min(Mp, Cb[i]*(Mp - (Mp - Fy_07*Sx[i]) *
+                                 (Lb[i] - Lp)/(Lr - Lp)))
+
+        phiMnx[i] = t(0.9) * Mn
+
+
+@numba.njit(nogil=True, fastmath=_FASTMATH, error_model='numpy', cache=True)
+def f6_flexure_minor(Sy, Zy, lambda_f, Fy, E, phiMny):
+    n = Sy.shape[0]
+    for i in range(n):
+        # Width-to-thickness ratios: AISC TABLE B4.1b Case 10
+        lambda_rf = math.sqrt(E / Fy[i])
+        lambda_pf = 0.38 * lambda_rf
+
+        # Plastic moment (AISC F6-1)
+        Mp = _min(Fy[i]*Zy[i], 1.6*Fy[i]*Sy[i])
+
+        # Flange Local Buckling
+        if lambda_f[i] <= lambda_pf:
+            Mn = Mp
+        elif lambda_f[i] >= lambda_rf:
+            # Elastic flange local buckling moment (AISC F6-3, F6-4)
+            Mn = (0.69*E*Sy[i]) / lambda_f[i]**2
+        else:
+            # Interpolate between Mp and reduced moment (AISC F6-2)
+            Mn = Mp - (Mp - 0.7 * Fy[i] * Sy[i]) * \
+                (lambda_f[i] - lambda_pf) / (lambda_rf - lambda_pf)
+
+        phiMny[i] = 0.9*Mn
+
+
+@numba.njit(nogil=True, fastmath=_FASTMATH, error_model='numpy', cache=True)
+def f8_flexure_round_hss(D, t, S, Z, Fy, E, phiMn):
+    n = D.shape[0]
+    for i in range(n):
+        D_t = D[i] / t[i]
+        E_Fy = E / Fy[i]
+
+        # F8 does not apply if D/t >= 0.45 E/Fy
+        if not D_t < 0.45 * E_Fy:
+            phiMn[i] = np.nan
+            continue
+
+        # Yielding (AISC F8-1)
+        Mp = Fy[i]*Z[i]
+
+        # Local buckling
+        if D_t < 0.07 * E_Fy:
+            Mn = Mp
+        elif D_t >= 0.31 * E_Fy:
+            # Slender sections (AISC F8-3, F8-4)
+            Mn = _min(Mp, 0.33*E/D_t * S[i])
+        else:
+            # Noncompact sections (AISC F8-2)
+            Mn = _min(Mp, (0.021*E/D_t + Fy[i]) * S[i])
+
+        phiMn[i] = 0.9*Mn
+
+
+@numba.njit(nogil=True, fastmath=_FASTMATH, error_model='numpy', cache=True)
+def h1_interaction(Pr, Pc, Mrx, Mcx, Mry, Mcy, DCR):
+    n = Pr.shape[0]
+    for i in range(n):
+        P_ratio = abs(Pr[i])/Pc[i]
+        M_total_int = abs(Mrx[i])/Mcx[i] + abs(Mry[i])/Mcy[i]
+
+        # AISC H1-1a, H1-1b. Both are cheap multiply-adds, so they are
+        # always evaluated and selected without a branch, which lets LLVM
+        # emit a vectorized FMA + blend loop.
+        DCR_a = 8/9 * M_total_int + P_ratio
+        DCR_b = 0.5 * P_ratio + M_total_int
+        DCR[i] = DCR_a if P_ratio >= 0.2 else DCR_b
@@ -1,4 +1,6 @@
+import comtypes
 import comtypes.client
+import numpy as np
 import sys
 from soms.datastructures import Frame
 from soms.datastructures import Joint
@@ -12,7 +14,16 @@ class ETABS:
     def __init__(self):
         self._client = None
         self._model = None
-        self.frames = {}
+        self.frames = []
+        self.joints = []
+        self.areas = []
+        self.frames_columns = {}
+        self.frames_coords = np.empty((0, 6))
+        self.frames_name_index = {}
+        self.joints_columns = {}
+        self.joints_name_index = {}
+        self.areas_columns = {}
+        self.areas_name_index = {}
 
     @property
     def client(self):
@@ -118,49 +129,65 @@ class ETABS:
         NumberNames, MyName, PropName, StoryName, PointName1, PointName2, Point1X, Point1Y, Point1Z, Point2X, Point2Y, \
             Point2Z, Angle, Offset1X, Offset2X, Offset1Y, Offset2Y, Offset1Z, Offset2Z, CardinalPoint, csys = ret
 
-        dict = {}
-        key_name = {}
-        key = 0
-        for i in range(NumberNames):
-            p1 = Joint(Point1X[i], Point1Y[i], Point1Z[i], name=PointName1[i])
-            p2 = Joint(Point2X[i], Point2Y[i], Point2Z[i], name=PointName2[i])
-            frame = Frame(p1, p2, section=PropName[i], name=MyName[i])
-            frame.StoryName = StoryName[i]
-            frame.Angle = Angle[i]
-            frame.Offset = [Offset1X, Offset2X, Offset1Y, Offset2Y, Offset1Z, Offset2Z]
-            frame.CardinalPoint = CardinalPoint[i]
-
-            dict[key] = frame
-            key_name[key] = MyName[i]
-            key += 1
-
-        self.frames = dict
-        self.frames_key_name = key_name
-
-        return dict
+        frames = [Frame(Joint(x1, y1, z1, name=n1), Joint(x2, y2, z2, name=n2), section=section, name=name)
+                  for x1, y1, z1, x2, y2, z2, n1, n2, section, name
+                  in zip(Point1X, Point1Y, Point1Z, Point2X, Point2Y, Point2Z,
+                         PointName1, PointName2, PropName, MyName)]
+        offsets = zip(Offset1X, Offset2X, Offset1Y, Offset2Y, Offset1Z, Offset2Z)
+        for frame, story, angle, offset, cardinal in zip(frames, StoryName, Angle, offsets, CardinalPoint):
+            frame.StoryName = story
+            frame.Angle = angle
+            frame.Offset = list(offset)
+            frame.CardinalPoint = cardinal
+
+        self.frames = frames
+        # The end coordinates are stored once, the x1..z2 columns are views of frames_coords
+        coords = np.column_stack((Point1X, Point1Y, Point1Z, Point2X, Point2Y, Point2Z)).astype(np.float64, copy=False)
+        self.frames_coords = coords
+        self.frames_columns = {
+            'name': np.asarray(MyName),
+            'section': np.asarray(PropName),
+            'story': np.asarray(StoryName),
+            **{key: coords[:, k] for k, key in enumerate(('x1', 'y1', 'z1', 'x2', 'y2', 'z2'))},
+            'angle': np.asarray(Angle, dtype=np.float64),
+        }
+        self.frames_name_index = {name: i for i, name in enumerate(MyName)}
+
+        return frames
 
     def GetJoints(self):
+        """Get all joints of the model with their restraints
+
+        Returns
+        -------
+        list
+            Joints of the model, see also ``joints_name_index``.
+        """
         if not self.client:
             return ValueError("ETABS Client not initialized. Check")
 
         ret = self.model.PointObj.GetAllPoints()
         NumberNames, MyName, X, Y, Z, cys = ret
 
-        dict = {}
-        key_name = {}
-        key = 0
+        restraints = [self.model.PointObj.GetRestraint(name)[0] for name in MyName]
+
+        joints = [None] * NumberNames
         for i in range(NumberNames):
-            ret, _ = self.model.PointObj.GetRestraint(MyName[i])
             pt = Joint(X[i], Y[i], Z[i], name=MyName[i])
-            pt.restraint = ret
-            dict[key] = pt
-            key_name[key] = MyName[i]
-            key += 1
+            pt.restraint = restraints[i]
+            joints[i] = pt
 
-        self.joints = dict
-        self.joints_key_name = key_name
+        self.joints = joints
+        self.joints_columns = {
+            'name': np.asarray(MyName),
+            'x': np.asarray(X, dtype=np.float64),
+            'y': np.asarray(Y, dtype=np.float64),
+            'z': np.asarray(Z, dtype=np.float64),
+            'restraint': np.asarray(restraints, dtype=bool).reshape(NumberNames, 6),
+        }
+        self.joints_name_index = {name: i for i, name in enumerate(MyName)}
 
-        return dict
+        return joints
 
     def GetAreas(self):
         if not self.client:
@@ -170,24 +197,26 @@ class ETABS:
         NumberNames, MyName, DesignOrientation, NumberBoundaryPts, PointDelimiter, \
             PointNames, PointX, PointY, PointZ, _ = ret
 
-        dict = {}
-        key_name = {}
-        key = 0
-        for i in range(NumberNames):
-            if i == 0:
-                a, b = 0, PointDelimiter[0] + 1
-            else:
-                a, b = PointDelimiter[i-1] + 1, PointDelimiter[i] + 1
-            pts = []
-            for j in range(len(PointNames[a:b])):
-                pt = Joint(PointX[a:b][j], PointY[a:b][j], PointZ[a:b][j], name=PointNames[a:b][j])
-                pts.append(pt)
-            areai = Area(points=pts, name=MyName[i])
-            dict[key] = areai
-            key_name[key] = MyName[i]
-            key += 1
-
-        self.areas = dict
-        self.areas_key_name = key_name
-
-        return dict
+        # Boundary points of area i are the slice starts[i]:ends[i]
+        delimiter = np.asarray(PointDelimiter, dtype=np.int64)
+        starts = np.concatenate(([0], delimiter[:-1] + 1)).tolist()
+        ends = (delimiter + 1).tolist()
+
+        areas = [None] * NumberNames
+        for i, a, b in zip(range(NumberNames), starts, ends):
+            pts = [Joint(x, y, z, name=n)
+                   for x, y, z, n in zip(PointX[a:b], PointY[a:b], PointZ[a:b], PointNames[a:b])]
+            areas[i] = Area(points=pts, name=MyName[i])
+
+        self.areas = areas
+        self.areas_columns = {
+            'name': np.asarray(MyName),
+            'point_delimiter': delimiter,
+            'point_name': np.asarray(PointNames),
+            'x': np.asarray(PointX, dtype=np.float64),
+            'y': np.asarray(PointY, dtype=np.float64),
+            'z': np.asarray(PointZ, dtype=np.float64),
+        }
+        self.areas_name_index = {name: i for i, name in enumerate(MyName)}
+
+        return areas
@@ -1,5 +1,6 @@
 """Frame Class"""
 
+import numpy as np
 from compas.geometry import Line
 
 
@@ -35,3 +36,22 @@ class Frame(Line):
         if qd < 1e-10:
             return ValueError("Length is Zero.")
         return qd**0.5
+
+    @classmethod
+    def lengths(cls, coords):
+        """Compute the lengths of many frames at once.
+
+        Parameters
+        ----------
+        coords : array_like
+            (N, 6) array of frame end coordinates, ``[x1, y1, z1, x2, y2, z2]``
+            per row, e.g. ``ETABS.frames_coords``.
+
+        Returns
+        -------
+        numpy.ndarray
+            (N,) array with the length of each frame.
+
+        """
+        coords = np.asarray(coords, dtype=np.float64)
+        return np.sqrt(np.sum((coords[:, 3:] - coords[:, :3])**2, axis=1))
@@ -17,15 +17,14 @@ class Joint(Point):
 
     """
 
+    __slots__ = ("_x", "_y", "_z", "_restraint")
+
     def __init__(self, x, y, z, name=None):
-        self._x = 0.0
-        self._y = 0.0
-        self._z = 0.0
+        self._x = float(x)
+        self._y = float(y)
+        self._z = float(z)
         self._restraint = None
         self.name = name
-        self.x = x
-        self.y = y
-        self.z = z
 
     @property
     def x(self):
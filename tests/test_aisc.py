@@ -0,0 +1,350 @@
+import warnings
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from soms.checks import E3_compression
+from soms.checks import F2_flexure_major
+from soms.checks import F6_flexure_minor
+from soms.checks import F8_flexure_round_hss
+from soms.checks import H1_interaction
+from soms.checks import P_delta
+from soms.checks.AISC import _POOL_MIN_SIZE
+from soms.checks.AISC import F9_flexure_t_2l
+
+# Reference values were computed with the original NumPy implementation of the checks.
+
+
+@pytest.fixture
+def props():
+    """Three W shapes (plastic, inelastic and elastic LTB for Lb below) and one channel."""
+    return {
+        'Type': np.array(['W', 'W', 'W', 'C']),
+        'ho': np.array([13., 13., 13., 9.]),
+        'J': np.array([.2, .2, .2, .1]),
+        'Sx': np.array([29., 29., 29., 11.]),
+        'Zx': np.array([33., 33., 33., 13.]),
+        'ry': np.array([1., 1., 1., .8]),
+        'rts': np.array([1.2, 1.2, 1.2, .9]),
+        'Iy': np.array([1., 1., 1., .9]),
+        'Cw': np.array([40., 40., 40., 20.]),
+    }
+
+
+LB_F2 = np.array([36., 120., 400., 120.])
+
+
+# ==============================================================================
+# P_delta
+# ==============================================================================
+
+def test_p_delta():
+    B1 = P_delta(np.array([-100., -400.]), 500., np.array([120., 240.]))
+    assert_allclose(B1, [1.01273801838177, 1.251948083983901])
+
+    B1 = P_delta(np.array([100., 400.]), 500., 240., Cm=np.array([.6, 1.]))
+    assert_allclose(B1, [0.6317859127384804, 1.251948083983901])
+
+
+def test_p_delta_sign():
+    with pytest.raises(AssertionError):
+        P_delta(np.array([-1., 10.]), 500., 120.)
+
+    # zero forces count as positive, whatever the sign of the zero
+    assert np.all(np.isfinite(P_delta(np.array([0., 10.]), 500., 120.)))
+    assert np.all(np.isfinite(P_delta(np.array([-0., 10.]), 500., 120.)))
+    with pytest.raises(AssertionError):
+        P_delta(np.array([-10., 0.]), 500., 120.)
+
+
+# ==============================================================================
+# E3
+# ==============================================================================
+
+def test_e3_compression():
+    # inelastic and elastic buckling
+    phiPn = E3_compression(10., np.array([4., 3.]), np.array([2., 1.]), np.array([120., 300.]), 50.)
+    assert_allclose(phiPn, [345.85700542829204, 25.101364873290564])
+
+
+def test_e3_broadcasting():
+    # members x load cases
+    Lb = np.array([[120.], [300.]])
+    phiPn = E3_compression(10., 4., np.array([2., 1., 2.]), Lb, 50.)
+    assert phiPn.shape == (2, 3)
+    assert_allclose(phiPn[0, 0], 345.85700542829204)
+    assert_allclose(phiPn[1, 1], 25.101364873290564)
+
+    phiPn = E3_compression(10., 4., 2., 120., 50.)
+    assert isinstance(phiPn, np.float64)
+    assert_allclose(phiPn, 345.85700542829204)
+
+
+def test_scalar_in_scalar_out():
+    assert isinstance(P_delta(-100., 500., 120.), np.float64)
+    assert isinstance(F2_flexure_major(120., 50., 'W', 13., .2, 29., 33., 1., 1.2), np.float64)
+    assert isinstance(F2_flexure_major(120., 50., 'W', 13., .2, 29., 33., 1., 1.2, dtype=np.float32), np.float32)
+    assert isinstance(F6_flexure_minor(10., 15., 5., 50.), np.float64)
+    assert isinstance(F8_flexure_round_hss(10., .5, 20., 26., 50.), np.float64)
+    assert isinstance(H1_interaction(-50., 500., 100., 400., 50., 200.), np.float64)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', UserWarning)
+        assert isinstance(F9_flexure_t_2l('WT', False, **F9_SECTION), np.float64)
+
+
+def test_e3_nan():
+    phiPn = E3_compression(10., 4., np.array([np.nan, 2.]), 120., 50.)
+    assert np.isnan(phiPn[0])
+    assert_allclose(phiPn[1], 345.85700542829204)
+
+
+# ==============================================================================
+# F2
+# ==============================================================================
+
+def test_f2_flexure_major(props):
+    assert_allclose(F2_flexure_major(LB_F2, 50., props=props),
+                    [1485.0, 888.2417450671372, 159.06902326098214, 243.66421703218708])
+    assert_allclose(F2_flexure_major(LB_F2, 50., props=props, Cb=1.3),
+                    [1485.0, 1154.7142685872786, 206.7897302392768, 316.76348214184327])
+
+
+def test_f2_w_only(props):
+    w = {key: value[:3] for key, value in props.items()}
+    assert_allclose(F2_flexure_major(LB_F2[:3], 50., props=w),
+                    [1485.0, 888.2417450671372, 159.06902326098214])
+
+
+def test_f2_section_type_arguments(props):
+    args = {key: props[key] for key in ('ho', 'J', 'Sx', 'Zx', 'ry', 'rts', 'Iy', 'Cw')}
+    assert_allclose(F2_flexure_major(LB_F2, 50., section_type=props['Type'], **args),
+                    F2_flexure_major(LB_F2, 50., props=props))
+
+
+def test_f2_section_type_invalid(props):
+    props['Type'][0] = 'L'
+    with pytest.raises(AssertionError):
+        F2_flexure_major(LB_F2, 50., props=props)
+
+
+def test_f2_nan(props):
+    props['J'][1] = np.nan
+    Lb = LB_F2.copy()
+    Lb[3] = np.nan
+    phiMnx = F2_flexure_major(Lb, 50., props=props)
+    assert np.isnan(phiMnx[[1, 3]]).all()
+    assert_allclose(phiMnx[[0, 2]], [1485.0, 159.06902326098214])
+
+
+@pytest.mark.parametrize('types', [['W'], ['W', 'C']])
+def test_f2_float32(types):
+    rng = np.random.default_rng(0)
+    n = 5000
+    ry = rng.uniform(.5, 4., n)
+    Sx = rng.uniform(10., 500., n)
+    props = {
+        'Type': rng.choice(np.array(types), n),
+        'ho': rng.uniform(5., 30., n),
+        'J': rng.uniform(.1, 10., n),
+        'Sx': Sx,
+        'Zx': 1.12 * Sx,
+        'ry': ry,
+        'rts': 1.15 * ry,
+        'Iy': rng.uniform(1., 50., n),
+        'Cw': rng.uniform(50., 5000., n),
+    }
+    Lb = rng.uniform(10., 800., n)
+    Fy = rng.choice([36., 50., 65.], n)
+
+    phiMnx = F2_flexure_major(Lb, Fy, props=props, dtype=np.float32)
+    assert phiMnx.dtype == np.float32
+    assert_allclose(phiMnx, F2_flexure_major(Lb, Fy, props=props), rtol=1e-5)
+
+
+# ==============================================================================
+# F6
+# ==============================================================================
+
+def test_f6_flexure_minor():
+    # compact, noncompact and slender flanges
+    phiMny = F6_flexure_minor(10., 15., np.array([5., 15., 30.]), 50.)
+    assert_allclose(phiMny, [675.0, 533.9954909595195, 200.10000000000002])
+
+
+def test_f6_nan():
+    phiMny = F6_flexure_minor(np.array([np.nan, 10.]), 15., 5., 50.)
+    assert np.isnan(phiMny[0])
+    assert_allclose(phiMny[1], 675.0)
+
+
+# ==============================================================================
+# F8
+# ==============================================================================
+
+def test_f8_flexure_round_hss():
+    # compact, noncompact and slender walls
+    phiMn = F8_flexure_round_hss(np.array([10., 60., 120.]), .5, 20., 26., 50.)
+    assert_allclose(phiMn, [1170.0, 991.35, 717.75])
+
+
+def test_f8_out_of_scope():
+    # D/t >= 0.45 E/Fy is flagged with NaN
+    phiMn = F8_flexure_round_hss(np.array([10., 131.]), .5, 20., 26., 50.)
+    assert_allclose(phiMn[0], 1170.0)
+    assert np.isnan(phiMn[1])
+
+
+def test_f8_nan():
+    phiMn = F8_flexure_round_hss(np.array([60., 120.]), .5, np.nan, 26., 50.)
+    assert np.isnan(phiMn).all()
+
+
+# ==============================================================================
+# F9
+# ==============================================================================
+
+F9_SECTION = dict(d=8., tw=.5, Sx=5., Zx=9., J=.5, Iy=10., y=2., lambda_f=6., Lb=60., Fy=50.)
+
+# stem in compression, d/tw = 16, 22.2 and 32: yielding, inelastic and elastic stem buckling
+F9_STEM_TW = np.array([.5, .36, .25])
+F9_STEM = [225.0, 191.74079267279612, 87.9345703125]
+
+
+def f9(stem_tension=False, **kwargs):
+    return F9_flexure_t_2l('WT', stem_tension, **dict(F9_SECTION, **kwargs))
+
+
+ignore_f9_warning = pytest.mark.filterwarnings("ignore:F9 provisions might not be correctly implemented")
+
+
+@ignore_f9_warning
+def test_f9_flange():
+    # compact, noncompact and slender flanges
+    lambda_f = np.array([6., 12., 30.])
+    assert_allclose(f9(True, lambda_f=lambda_f), [360.0, 321.3705515769451, 101.5])
+    assert_allclose(f9(False, lambda_f=lambda_f), [225.0, 212.123517192315, 101.5])
+
+
+@ignore_f9_warning
+def test_f9_stem():
+    assert_allclose(f9(False, tw=F9_STEM_TW), F9_STEM)
+    # stem local buckling does not apply to stems in tension
+    assert_allclose(f9(True, tw=F9_STEM_TW), [360.0, 360.0, 360.0])
+    assert_allclose(f9(np.array([True, False, False]), tw=F9_STEM_TW), [360.0] + F9_STEM[1:])
+
+
+@ignore_f9_warning
+def test_f9_nan():
+    phiMn = f9(False, tw=np.array([np.nan, .5]))
+    assert np.isnan(phiMn[0])
+    assert_allclose(phiMn[1], 225.0)
+
+
+@ignore_f9_warning
+def test_f9_zero():
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', RuntimeWarning)
+        phiMn = f9(np.array([True, False]), Lb=0.)
+        assert_allclose(phiMn[0], 360.0)
+        assert np.isnan(phiMn[1])
+
+        assert_allclose(f9(np.array([True, False]), Sx=0.), [0., 0.])
+
+
+@ignore_f9_warning
+def test_f9_pooled_buffers():
+    n = _POOL_MIN_SIZE + 1
+    tw = np.resize(F9_STEM_TW, n)
+    stem_tension = np.arange(n) % 2 == 0
+    expected = np.where(stem_tension, 360.0, np.resize(F9_STEM, n))
+
+    # the first call leaves the pooled buffers filled with other values
+    f9(True, tw=tw, lambda_f=30.)
+    for _ in range(2):
+        assert_allclose(f9(stem_tension, tw=tw), expected)
+
+
+# ==============================================================================
+# H1
+# ==============================================================================
+
+def test_h1_interaction():
+    # H1-1b and H1-1a
+    DCR = H1_interaction(np.array([-50., -300.]), 500., np.array([100., -100.]), 400., 50., 200.)
+    assert_allclose(DCR, [0.55, 1.0444444444444443])
+
+
+def test_h1_sign():
+    with pytest.raises(AssertionError):
+        H1_interaction(np.array([-50., 300.]), 500., 100., 400., 50., 200.)
+
+    DCR = H1_interaction(np.array([0., 300.]), 500., 100., 400., 50., 200.)
+    assert_allclose(DCR[0], 0.5)
+    DCR = H1_interaction(np.array([-0., 300.]), 500., 100., 400., 50., 200.)
+    assert_allclose(DCR[0], 0.5)
+
+
+# ==============================================================================
+# Threaded dispatch
+# ==============================================================================
+
+def check_batches():
+    """Every compiled check with its arguments, on a seeded batch of members x 3 load cases."""
+    rng = np.random.default_rng(1)
+    n = 1000
+
+    def members(low, high):
+        return rng.uniform(low, high, (n, 1))
+
+    def cases(low, high):
+        return rng.uniform(low, high, (n, 3))
+
+    Lb = cases(10., 800.)
+    Fy = members(36., 65.)
+    Pr = -cases(1., 500.)
+    Sx = members(10., 500.)
+    ry = members(.5, 4.)
+    t = members(.1, .5)
+    props = {
+        'Type': np.where(rng.random((n, 1)) < .3, 'C', 'W'),
+        'ho': members(5., 30.),
+        'J': members(.1, 10.),
+        'Sx': Sx,
+        'Zx': 1.12 * Sx,
+        'ry': ry,
+        'rts': 1.15 * ry,
+        'Iy': members(1., 50.),
+        'Cw': members(50., 5000.),
+    }
+    props_w = dict(props, Type=np.full((n, 1), 'W'))
+
+    return [
+        (P_delta, (Pr, members(100., 1000.), Lb), {'Cm': .85}),
+        (E3_compression, (members(1., 50.), members(1., 10.), ry, Lb, Fy), {}),
+        (F2_flexure_major, (Lb, Fy), {'props': props}),
+        (F2_flexure_major, (Lb, Fy), {'props': props_w}),
+        (F2_flexure_major, (Lb, Fy), {'props': props_w, 'dtype': np.float32}),
+        (F6_flexure_minor, (members(2., 100.), members(3., 150.), cases(2., 40.), Fy), {}),
+        (F8_flexure_round_hss, (t * cases(5., 300.), t, members(1., 100.), members(1., 130.), Fy), {}),
+        (H1_interaction, (Pr, members(100., 1000.), Lb, 600., -Lb, 700.), {}),
+    ]
+
+
+def test_threaded_dispatch(monkeypatch):
+    from soms.checks import _kernels
+
+    batches = check_batches()
+    serial = [check(*args, **kwargs) for check, args, kwargs in batches]
+
+    monkeypatch.setattr(_kernels, '_WORKERS', 7)
+    monkeypatch.setattr(_kernels, 'PARALLEL_MIN_SIZE', 1)
+    monkeypatch.setattr(_kernels, '_executor', None)
+    threaded = [check(*args, **kwargs) for check, args, kwargs in batches]
+    assert _kernels._executor is not None
+    _kernels._executor.shutdown()
+
+    for a, b in zip(serial, threaded):
+        assert a.shape == b.shape == (1000, 3)
+        assert a.dtype == b.dtype
+        np.testing.assert_array_equal(a, b)
@@ -0,0 +1,108 @@
+import sys
+from types import ModuleType
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+CONNECTORS = ('soms.connectors', 'soms.connectors.etabs', 'soms.connectors.sap')
+
+
+@pytest.fixture
+def ETABS(monkeypatch):
+    """The ETABS connector class, imported against a comtypes stub where COM is not available.
+
+    The tests only talk to a fake cSapModel, so no COM call is ever made.
+    """
+    try:
+        import comtypes.client  # noqa: F401
+    except ImportError:
+        comtypes = ModuleType('comtypes')
+        comtypes.COMError = OSError
+        comtypes.client = ModuleType('comtypes.client')
+        monkeypatch.setitem(sys.modules, 'comtypes', comtypes)
+        monkeypatch.setitem(sys.modules, 'comtypes.client', comtypes.client)
+        stubbed = True
+    else:
+        stubbed = False
+
+    from soms.connectors import ETABS
+    yield ETABS
+
+    # do not leave connectors bound to the stub behind for other tests
+    if stubbed:
+        for name in CONNECTORS:
+            sys.modules.pop(name, None)
+        vars(sys.modules['soms']).pop('connectors', None)
+
+
+def fake_model():
+    """Stand-in for the cSapModel interface, returning what the API getters return."""
+    frames = (2, ('F1', 'F2'), ('W14X22', 'W12X19'), ('Story1', 'Story2'), ('1', '2'), ('2', '3'),
+              (0., 1.), (0., 0.), (0., 0.), (1., 1.), (0., 3.), (4., 0.), (0., 90.),
+              (0., .1), (0., .2), (0., 0.), (0., 0.), (0., 0.), (0., 0.), (10, 8), 'Global')
+    points = (3, ('1', '2', '3'), (0., 1., 1.), (0., 0., 3.), (0., 4., 0.), 'Global')
+    areas = (2, ('A1', 'A2'), (1, 1), (3, 4), (2, 6), ('1', '2', '3', '1', '2', '3', '4'),
+             (0., 1., 1., 0., 1., 1., 0.), (0., 0., 3., 0., 0., 3., 3.), (0.,) * 7, 0)
+
+    return SimpleNamespace(
+        FrameObj=SimpleNamespace(GetAllFrames=lambda: frames),
+        PointObj=SimpleNamespace(GetAllPoints=lambda: points,
+                                 GetRestraint=lambda name: ((name == '1',) * 6, 0)),
+        AreaObj=SimpleNamespace(GetAllAreas=lambda: areas),
+    )
+
+
+@pytest.fixture
+def session(ETABS):
+    session = ETABS()
+    session.client = object()
+    session.model = fake_model()
+    return session
+
+
+def test_name_index_before_fetch(ETABS):
+    session = ETABS()
+    assert session.frames_name_index == {}
+    assert session.joints_name_index == {}
+    assert session.areas_name_index == {}
+
+
+def test_get_frames(session):
+    frames = session.GetFrames()
+
+    assert [frame.name for frame in frames] == ['F1', 'F2']
+    assert session.frames_name_index == {'F1': 0, 'F2': 1}
+    assert frames[1].section == 'W12X19'
+    assert frames[1].StoryName == 'Story2'
+    assert frames[1].Offset == [.1, .2, 0., 0., 0., 0.]
+    assert frames[1].CardinalPoint == 8
+    np.testing.assert_array_equal(session.frames_coords, [[0., 0., 0., 1., 0., 4.],
+                                                          [1., 0., 0., 1., 3., 0.]])
+    np.testing.assert_array_equal(session.frames_columns['angle'], [0., 90.])
+    # the end coordinates are stored once
+    for k, key in enumerate(('x1', 'y1', 'z1', 'x2', 'y2', 'z2')):
+        assert np.shares_memory(session.frames_columns[key], session.frames_coords)
+        np.testing.assert_array_equal(session.frames_columns[key], session.frames_coords[:, k])
+
+
+def test_get_joints(session):
+    joints = session.GetJoints()
+
+    assert [joint.name for joint in joints] == ['1', '2', '3']
+    assert session.joints_name_index == {'1': 0, '2': 1, '3': 2}
+    assert joints[2].z == 0.
+    assert joints[0].restraint == (True,) * 6
+    restraint = session.joints_columns['restraint']
+    assert restraint.shape == (3, 6)
+    np.testing.assert_array_equal(restraint.any(axis=1), [True, False, False])
+
+
+def test_get_areas(session):
+    areas = session.GetAreas()
+
+    assert [area.name for area in areas] == ['A1', 'A2']
+    assert session.areas_name_index == {'A1': 0, 'A2': 1}
+    assert [point.name for point in areas[0].points] == ['1', '2', '3']
+    assert [point.name for point in areas[1].points] == ['1', '2', '3', '4']
+    assert (areas[1].points[3].x, areas[1].points[3].y) == (0., 3.)
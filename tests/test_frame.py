@@ -0,0 +1,23 @@
+import numpy as np
+from numpy.testing import assert_allclose
+
+from soms.datastructures import Frame
+from soms.datastructures import Joint
+
+
+def test_lengths():
+    rng = np.random.default_rng(0)
+    coords = rng.uniform(-100., 100., (50, 6))
+    frames = [Frame(Joint(*row[:3]), Joint(*row[3:])) for row in coords]
+
+    lengths = Frame.lengths(coords)
+    assert lengths.shape == (50,)
+    assert_allclose(lengths, [frame.length() for frame in frames])
+
+    assert_allclose(Frame.lengths([[0., 0., 0., 3., 4., 12.]]), [13.])
+
+
+def test_lengths_empty():
+    lengths = Frame.lengths(np.empty((0, 6)))
+    assert lengths.shape == (0,)
+    assert lengths.dtype == np.float64